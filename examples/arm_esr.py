@@ -18,7 +18,7 @@ class ISS_reg_base(HwRegister):
 
 ARM_EC_VALUES: Dict[int, Tuple[Type[ISS_reg_base], str]] = {}
 
-class ARM_ESR(HWRegister):
+class ARM_ESR(HwRegister):
     ess2 = HwBits(32, 36)
     ec = HwBits(26, 31, "Exception class")
     il = HwBits(25, doc="Instruction Length")
@@ -27,12 +27,9 @@ class ARM_ESR(HWRegister):
     @property
     def iss(self):
         """Return a register object for ISS bits"""
-        try:
-            cls = ARM_EC_VALUES[self.iss_bits][0]
-            return cls(self.iss_bits)
-        except KeyError:
-            # this value not yet implemented
-            return ISS_reg_base(self.iss_bits)
+        # classes not yet implemented decode as the plain base
+        cls = ARM_EC_VALUES.get(self.ec, (ISS_reg_base,))[0]
+        return cls(self.iss_bits)
 
 
 class ISS_unknown(ISS_reg_base):
@@ -62,7 +59,7 @@ class ISS_mcr_mrc(ISS_reg_base):
 
     Opc2 = HwBits(17, 19)
     Opc1 = HwBits(14, 16)
-    CRn = HWBits(10, 13)
+    CRn = HwBits(10, 13)
     Rt = HwBits(5, 9)
     CRm = HwBits(1, 4)
     direction = HwBits(0)
@@ -6,11 +6,11 @@
 """Parser of Common Platform Error Record (CPER)
 """
 
+import struct
 import time
 
 from .hwstructs import (
     DataStruct,
-    GUID,
     MultiSectionsVar,
     Nested,
     ParentBody,
@@ -19,7 +19,7 @@ from .hwstructs import (
     Text,
     UChar,
 )
-from .little_endian import DynSizeUL, StaticUL, ULong, ULong64, UShort
+from .little_endian import DynSizeUL, GUID, StaticUL, ULong, ULong64, UShort
 from .registers import HwBits, HwRegister
 
 # fmt: off
@@ -65,18 +65,26 @@ class CPER_timestamp(DataStruct):
     year = UChar(6)
     century = UChar(7)
 
+    # all UChar members above, in offset order (flags skipped)
+    _fields_struct = struct.Struct("<BBBxBBBB")
+
+    def _fields(self):
+        return self._fields_struct.unpack_from(self._data)
+
     def __str__(self):
-        return f"{self.century-1}{self.year:02d}-{self.month:02d}-{self.day:02d} "\
-                f"{self.hours:02d}:{self.minutes:02d}:{self.seconds:02d}"
+        seconds, minutes, hours, day, month, year, century = self._fields()
+        return f"{century-1}{year:02d}-{month:02d}-{day:02d} "\
+                f"{hours:02d}:{minutes:02d}:{seconds:02d}"
 
     @property
     def datetime(self) -> int:
         return self.__int__()
 
     def __int__(self):
-        year = (self.century -1) * 100 + self.year
-        ts = time.mktime((year, self.month, self.day,
-                            self.hours, self.minutes, self.seconds,
+        seconds, minutes, hours, day, month, year, century = self._fields()
+        year = (century -1) * 100 + year
+        ts = time.mktime((year, month, day,
+                            hours, minutes, seconds,
                             -1, -1, -1))
         return int(ts)
 
@@ -5,6 +5,8 @@
 
 from __future__ import annotations
 
+import copy
+import functools
 import struct
 import typing
 import uuid
@@ -13,6 +15,13 @@ from typing import Optional, Tuple, Type
 
 
 # fmt: off
+_MISSING = object()  # sentinel for a not-yet cached member value
+
+# Below this, concatenating a dyn-size tail to the head is faster than
+# `readinto()` a preallocated buffer. Above it, copying dominates
+_READINTO_SIZE = 0x10000
+
+
 class DataStructDescr:
     """Any descriptor (direct or indirect) of the DataStruct"""
 
@@ -37,9 +46,13 @@ class DataStructMember(DataStructDescr):  # pyre-ignore
 
     Used for members that occupy fixed space on the struct.
     Most important, each member "knows" its offset on the binary struct
+
+    Struct data is immutable, so the decoded value is cached in a slot of
+    the DataStruct instance upon first read. Subclasses only need to
+    implement `_decode()`.
     """
 
-    __slots__: Tuple[str, ...] = ("_offset", )
+    __slots__: Tuple[str, ...] = ("_offset", "_cache_name")
 
     _size: int   # needs to be specified per subclass
 
@@ -50,6 +63,23 @@ class DataStructMember(DataStructDescr):  # pyre-ignore
     def size(self):
         return self._size
 
+    def init_slots(self, name: str):
+        self._cache_name = f"_cache_{name}"
+        return (self._cache_name,)
+
+    def __get__(self, data: DataStruct, owner=None):
+        if data is None:
+            return self
+        cache = self._cache_name
+        val = getattr(data, cache, _MISSING)
+        if val is _MISSING:
+            val = self._decode(data)
+            setattr(data, cache, val)
+        return val
+
+    def _decode(self, data: DataStruct):
+        raise NotImplementedError(f"base class for {self.__class__.__name__}")
+
 
 class DynSizeBase:
     """Placeholder baseclass for that struct member which conveys dynamic size
@@ -78,10 +108,17 @@ class DataStructMeta(type):
 
             # locate descriptor with highest offset
             cur_dyn = None
-            for n, descr in namespace.items():
-                if n.startswith("_"):
+            members = []
+            for n, descr in list(namespace.items()):
+                if n.startswith("__") or not isinstance(descr, DataStructDescr):
                     continue
-                if not isinstance(descr, DataStructDescr):
+                if isinstance(descr, DataStructMember):
+                    if getattr(descr, '_cache_name', None) is not None:
+                        # already bound to the slot of another member, reused
+                        descr = namespace[n] = copy.copy(descr)
+                    slots += descr.init_slots(n)
+                members.append((n, descr))
+                if n.startswith("_"):
                     continue
                 dsize = descr.size
                 if dsize and hasattr(descr, '_offset'):
@@ -103,10 +140,130 @@ class DataStructMeta(type):
                                     f"fixed size: {min_size} > {size}")
             elif size is None:
                 size = min_size
-            namespace['_DataStruct__static_size'] = size
-            namespace['_DataStruct__dyn_size_member'] = cur_dyn
-
-        return super().__new__(metacls, name, bases, namespace, **kwds)
+            namespace['_static_size'] = size
+            namespace['_dyn_size_member'] = cur_dyn
+            # only those that override the default, passing `_check()`
+            namespace['_checkable_members'] = tuple((n, descr) for n, descr in members
+                                                    if type(descr)._check is not DataStructDescr._check)
+            namespace['_extra_members'] = tuple((n, descr) for n, descr in members
+                                                if isinstance(descr, DataStructExtraData))
+            if cur_dyn is None:
+                row_struct, row_members = metacls._row_layout(members, size)
+            else:
+                row_struct, row_members = None, ()
+            namespace['_row_struct'] = row_struct
+            namespace['_row_members'] = tuple(n for n, descr in row_members)
+            namespace['_row_slots'] = tuple(descr._cache_name for n, descr in row_members)
+
+            parse = metacls._gen_parser(namespace, f"{namespace.get('__qualname__', name)}.__init__")
+            namespace['_parse'] = parse
+
+        cls = super().__new__(metacls, name, bases, namespace, **kwds)
+        # A custom `__init__()` inherited from a parent struct must still run,
+        # it reaches this layout anyway through `DataStruct.__init__()`
+        if bases and '__init__' not in namespace and (
+                cls.__init__ is DataStruct.__init__ or getattr(cls.__init__, '_generated', False)):
+            cls.__init__ = parse
+        return cls
+
+    @staticmethod
+    def _gen_parser(namespace, qualname: str):
+        """Generate the `__init__()` code, specialized for this very struct
+
+        Sizes are spelled as constants and the `_check()`/`_init_extra()`
+        calls are unrolled, so that no class attributes or member lists
+        need to be walked for every parsed struct.
+
+        Data is kept as a read-only `memoryview`, for streams and buffers
+        alike, so that members never need to check its type. Long tails of
+        dyn-size structs are read with `readinto()`, straight into place.
+        """
+        ss = namespace['_static_size']
+        dsm = namespace['_dyn_size_member']
+        env = {'__name__': namespace.get('__module__', __name__), '_dsm': dsm, '_ss': ss}
+        src = [
+            "def __init__(self, buf):",
+            "    if isinstance(buf, memoryview):",
+            f"        self._data = buf[:{ss!r}]",
+            "    else:",
+            # streams have no parent data, see `ParentBody`
+            "        self._parent_data = None",
+            f"        self._data = memoryview(buf.read({ss!r}))",
+            f"    if len(self._data) < {ss!r}:",
+            "        raise IOError(5, 'Stream data is shorter than struct: '",
+            "                         f'{len(self._data)} < {_ss}')",
+        ]
+        if dsm:
+            env['_dyn_get'] = namespace[dsm].__get__
+            src += [
+                "    ds = _dyn_get(self)",
+                f"    if ds < {ss!r}:",
+                "        raise ValueError('Computed dynamic size is less than static: '",
+                "                         f'{_dsm}={ds} < {_ss}')",
+                "    if isinstance(buf, memoryview):",
+                "        self._data = buf[:ds]",
+                # plain `read()`-only streams always concatenate
+                f"    elif ds - {ss!r} < {_READINTO_SIZE} or not hasattr(buf, 'readinto'):",
+                f"        self._data = memoryview(self._data.obj + buf.read(ds - {ss!r}))",
+                "    else:",
+                # allocate once, read the rest in place
+                "        mv = memoryview(bytearray(ds))",
+                f"        mv[:{ss!r}] = self._data",
+                f"        got = buf.readinto(mv[{ss!r}:]) or 0",
+                f"        self._data = mv[:{ss!r} + got].toreadonly()",
+                "    if len(self._data) < ds:",
+                "        raise IOError(5, 'Stream data is shorter than expected: '",
+                "                         f'{len(self._data)} < {ds}')",
+            ]
+        for i, (n, descr) in enumerate(namespace['_checkable_members']):
+            env[f'_check_{i}'] = descr._check
+            src.append(f"    _check_{i}({n!r}, self)")
+        for i, (n, descr) in enumerate(namespace['_extra_members']):
+            env[f'_init_extra_{i}'] = descr._init_extra
+            src.append(f"    _init_extra_{i}(self)")
+
+        exec(compile("\n".join(src), f"<DataStruct {qualname}>", "exec"), env)
+        parse = env['__init__']
+        parse.__qualname__ = qualname
+        parse._generated = True
+        return parse
+
+    @staticmethod
+    def _row_layout(members, size: Optional[int]):
+        """Combine all `struct` based members into one `Struct`, padded to `size`
+
+        This decodes all scalars of a record in one call, and it can be
+        iterated over arrays of such records. Returns the Struct and the
+        `(name, descr)` of those members (in Struct order), or `(None, ())`
+        when members overlap, use different byte orders or go past `size`
+        (private `_name` members don't count for it).
+        Members that customize `_decode()` or `__get__()` are left out, their
+        raw values must not reach the caches.
+        """
+        scalars = sorted(((n, descr) for n, descr in members
+                          if isinstance(descr, DataStruct2Member)
+                          and type(descr)._decode is DataStruct2Member._decode
+                          and type(descr).__get__ is DataStruct2Member.__get__),
+                         key=lambda member: member[1]._offset)
+        if not (size and scalars):
+            return None, ()
+        order = scalars[0][1]._struct.format[0]
+        if order not in "<>!=":
+            return None, ()
+        fmt = order
+        pos = 0
+        for n, descr in scalars:
+            if descr._struct.format[0] != order or descr._offset < pos:
+                return None, ()
+            if descr._offset > pos:
+                fmt += f"{descr._offset - pos}x"
+            fmt += descr._struct.format[1:]
+            pos = descr._offset + descr._size
+        if pos > size:
+            return None, ()
+        if size > pos:
+            fmt += f"{size - pos}x"
+        return struct.Struct(fmt), tuple(scalars)
 
 
 class DataStruct(metaclass=DataStructMeta):  # pyre-ignore
@@ -126,46 +283,73 @@ class DataStruct(metaclass=DataStructMeta):  # pyre-ignore
     >>> print(s.rec_number)
     """
 
-    __static_size: int
-    __dyn_size_member: Optional[str]
-    __slots__ = ("_data", )
+    _static_size: int
+    _dyn_size_member: Optional[str]
+    _checkable_members: Tuple[Tuple[str, DataStructDescr], ...]
+    _extra_members: Tuple[Tuple[str, DataStructExtraData], ...]
+    _row_struct: Optional[struct.Struct]
+    _row_members: Tuple[str, ...]
+    _row_slots: Tuple[str, ...]
+    _parse: typing.Callable[[DataStruct, typing.BinaryIO], None]
+    _data: memoryview
+    _parent_data: memoryview
+    __slots__ = ("_data", "_parent_data")
     _name_var: Optional[str] = None
 
+    def __init__(self, buf: typing.BinaryIO):
+        # Subclasses get their own, generated by `DataStructMeta._gen_parser()`.
+        # This one is only reached by a custom `__init__()` calling `super()`
+        self._parse(buf)
+
     @classmethod
-    def __iter_members(cls):
-        for n, descr in cls.__dict__.items():
-            if n.startswith('__'):
-                continue
-            if isinstance(descr, DataStructDescr):
-                yield n, descr
+    def _nested(cls, buf: memoryview, parent: memoryview) -> DataStruct:
+        """Parse a struct nested in `parent`, the data of the enclosing one"""
+        d = cls.__new__(cls)
+        # set before `__init__()`, so that custom ones keep their signature
+        d._parent_data = parent
+        d.__init__(buf)
+        return d
 
-    def __init__(self, buf: typing.BinaryIO):
-        if isinstance(buf, memoryview):
-            self._data = buf[:self.__static_size]
-        else:
-            self._data = buf.read(self.__static_size)
-        if len(self._data) < self.__static_size:
-            raise IOError(5, "Stream data is shorter than struct: "
-                            f"{len(self._data)} < {self.__static_size}")
-
-        if self.__dyn_size_member:
-            ds = getattr(self, self.__dyn_size_member)
-            if ds < self.__static_size:
-                raise ValueError("Computed dynamic size is less than static: "
-                                 f"{self.__dyn_size_member}={ds} < {self.__static_size}")
-            else:
-                if isinstance(buf, memoryview):
-                    self._data = buf[:ds]
-                else:
-                    self._data += buf.read(ds - self.__static_size)
-                if len(self._data) < ds:
-                    raise IOError(5, "Stream data is shorter than expected: "
-                                  f"{len(self._data)} < {ds}")
+    @classmethod
+    def iter_from(cls, buf: bytes) -> typing.Iterator[DataStruct]:
+        """Parse consecutive structs out of a bytes-like buffer, up to its end
+
+        Meant for bulk ingestion, eg. a log of many CPER records. Structs are
+        views into `buf`, without copying.
+        A truncated trailing struct raises, like its constructor does.
+        """
+        mv = memoryview(buf)
+        offset = 0
+        while offset < len(mv):
+            d = cls(mv[offset:])
+            offset += len(d)
+            yield d
 
-        for name, descr in self.__iter_members():
-            descr._check(name, self)
-            if isinstance(descr, DataStructExtraData):
-                descr._init_extra(self)
+    @classmethod
+    def _parse_array(cls, buf: memoryview, offset: int, count: int) -> list:
+        """Parse `count` consecutive structs from `buf`, starting at `offset`"""
+        sections = []
+        row_struct = cls._row_struct
+        if row_struct is None:
+            for _ in range(count):
+                d = cls._nested(buf[offset:], buf)
+                offset += len(d)
+                sections.append(d)
+            return sections
+
+        # Fixed size: decode the scalars of all structs in one pass and seed
+        # their caches, before each struct is initialized
+        ssize = cls._static_size
+        slots = cls._row_slots
+        for row in row_struct.iter_unpack(buf[offset:offset + count * ssize]):
+            d = cls.__new__(cls)
+            for slot, val in zip(slots, row):
+                setattr(d, slot, val)
+            d._parent_data = buf
+            d.__init__(buf[offset:])
+            offset += ssize
+            sections.append(d)
+        return sections
 
     def __len__(self):
         return len(self._data)
@@ -194,14 +378,8 @@ class Static(DataStructMember):
         self._size = len(expected)
         self._expected = expected
 
-    def __get__(self, data: DataStruct, owner=None):
-        if data is None:
-            return self
-        d = data[self._offset:self._offset + self._size]
-        if isinstance(d, memoryview):
-            return bytes(d)
-        else:
-            return d
+    def _decode(self, data: DataStruct):
+        return bytes(data._data[self._offset:self._offset + self._size])
 
     def _check(self, name: str, data: DataStruct) -> None:
         val = self.__get__(data)
@@ -213,7 +391,10 @@ class structPoweredMember(type):
     """Metaclass for using `struct` based DataStructMember classes
 
     This will convert the `_struct_fmt` member to a `_struct = struct.Struct()`
-    instance, upon class creation.
+    instance, upon class creation. Its bound `unpack_from` is also kept as
+    `_unpack_from`, to spare one attribute lookup per access.
+    Subclasses overriding `_decode()` get back the generic
+    `DataStructMember.__get__`, the inlined one would bypass it.
     """
 
     def __new__(metacls, name, bases, namespace, **kwds):
@@ -221,6 +402,9 @@ class structPoweredMember(type):
         if fmt is not None:
             namespace['_struct'] = struct.Struct(fmt)
             namespace['_size'] = namespace['_struct'].size
+            namespace['_unpack_from'] = namespace['_struct'].unpack_from
+        if '_decode' in namespace and '__get__' not in namespace:
+            namespace['__get__'] = DataStructMember.__get__
         return super().__new__(metacls, name, bases, namespace, **kwds)
 
 
@@ -233,12 +417,23 @@ class DataStruct2Member(DataStructMember, metaclass=structPoweredMember):  # pyr
     """
     _struct_fmt: str
     _struct: struct.Struct
+    _unpack_from: typing.Callable[..., tuple]
 
     def __get__(self, data: DataStruct, owner=None):
+        # Hottest path of all, same as DataStructMember.__get__ with an
+        # inlined `_decode()` (only kept while `_decode()` isn't overridden)
         if data is None:
             return self
-        d = data[self._offset:self._offset + self._struct.size]
-        return self._struct.unpack(d)[0]
+        cache = self._cache_name
+        val = getattr(data, cache, _MISSING)
+        if val is _MISSING:
+            val = self._unpack_from(data._data, self._offset)[0]
+            setattr(data, cache, val)
+        return val
+
+    def _decode(self, data: DataStruct):
+        # decode in-place, without slicing the buffer first
+        return self._unpack_from(data._data, self._offset)[0]
 
 
 class UChar(DataStruct2Member):
@@ -254,27 +449,69 @@ class HwBytes(DataStructMember):
         self._offset = offset
         self._size = size
 
-    def __get__(self, data: DataStruct, owner=None):
-        if data is None:
-            return self
+    def _decode(self, data: DataStruct):
+        return bytes(data._data[self._offset:self._offset + self._size])
+
+
+@functools.total_ordering
+class FastGUID:
+    """GUID value, kept as its 16 bytes (in `uuid.UUID(bytes=)` order)
+
+    The `uuid.UUID` is only built when needed, eg. for `str()` or any of its
+    other attributes. Compares, orders and hashes the same as the matching
+    `uuid.UUID`, but is not one: `isinstance(x, uuid.UUID)` is False, use
+    `x.uuid()` where a real `uuid.UUID` is required.
+    """
+    __slots__ = ("_b", )
+
+    def __init__(self, b: bytes):
+        self._b = b
+
+    def uuid(self) -> uuid.UUID:
+        return uuid.UUID(bytes=self._b)
+
+    @staticmethod
+    def _other_bytes(other) -> Optional[bytes]:
+        if type(other) is FastGUID:
+            return other._b
+        if isinstance(other, uuid.UUID):
+            return other.bytes
+        return None
+
+    def __eq__(self, other):
+        b = self._other_bytes(other)
+        if b is None:
+            return NotImplemented
+        return self._b == b
 
-        d = data[self._offset:self._offset + self._size]
-        if isinstance(d, memoryview):
-            return bytes(d)
-        else:
-            return d
+    def __lt__(self, other):
+        # big-endian bytes order the same as `uuid.UUID.int`
+        b = self._other_bytes(other)
+        if b is None:
+            return NotImplemented
+        return self._b < b
+
+    def __hash__(self):
+        return hash(int.from_bytes(self._b, 'big'))  # same as uuid.UUID
+
+    def __getattr__(self, name):
+        if name.startswith('_'):
+            raise AttributeError(name)
+        return getattr(self.uuid(), name)
+
+    def __str__(self):
+        return str(self.uuid())
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}('{self}')"
 
 
 class GUID(DataStructMember):
-    """"GUID/UUID member"""
+    """"GUID/UUID member, decoded as `FastGUID`"""
     _size = 16
 
-    def __get__(self, data: DataStruct, owner=None):
-        if data is None:
-            return self
-
-        u = data[self._offset:self._offset + 16]
-        return uuid.UUID(bytes=bytes(u))
+    def _decode(self, data: DataStruct):
+        return FastGUID(bytes(data._data[self._offset:self._offset + 16]))
 
 
 class Text(DataStructMember):
@@ -286,19 +523,15 @@ class Text(DataStructMember):
         self._size = size
         self._encoding = encoding
 
-    def __get__(self, data: DataStruct, owner=None):
-        if data is None:
-            return self
-        t = data[self._offset:self._offset + self._size]
-        if isinstance(t, memoryview):
-            t = bytes(t)
+    def _decode(self, data: DataStruct):
+        t = data._data[self._offset:self._offset + self._size]
 
-        # bytes.decode() would preserve the full length of a null-padded string,
-        # we have to explicitly reduce that
-        n = t.find(b'\x00')
+        # decoding would preserve the full length of a null-padded string,
+        # we have to explicitly reduce that. str() takes the view directly
+        n = t.tobytes().find(b'\x00')
         if n >= 0:
             t = t[:n]
-        return t.decode(self._encoding)
+        return str(t, self._encoding)
 
 
 class Reg(DataStructMember):
@@ -310,10 +543,18 @@ class Reg(DataStructMember):
         self._size = size
         self._reg_cls = reg_cls
 
+    def init_slots(self, name: str):
+        # registers are mutable, so they are never cached: each read gets
+        # a fresh one, that cannot drift from the data
+        return ()
+
     def __get__(self,  data: DataStruct, owner=None):
         if data is None:
             return self
-        val = data[self._offset:self._offset + self._size]
+        return self._decode(data)
+
+    def _decode(self,  data: DataStruct):
+        val = data._data[self._offset:self._offset + self._size]
         return self._reg_cls.from_bytes_lsb(val)
 
 
@@ -330,9 +571,6 @@ class DataStructExtraData(DataStructDescr):
     def _init_extra(self, data: DataStruct):
         pass
 
-    def _check(self, name: str, data: DataStruct) -> None:
-        pass
-
     def __get__(self,  data: DataStruct, owner=None):
         if data is None:
             return self
@@ -349,16 +587,16 @@ class Nested(DataStructExtraData):
 
     @property
     def size(self):
-        return self._klass._DataStruct__static_size
+        return self._klass._static_size
 
     def _check(self, name: str, data: DataStruct) -> None:
         if len(data) < self._offset + self.size:
             raise IndexError(f"Not enough data for {name}= {self.size}")
 
     def _init_extra(self, data: DataStruct):
-        mv = memoryview(data._data)
+        mv = data._data
         offset = self._offset
-        d = self._klass(mv[offset:])  # pyre-ignore
+        d = self._klass._nested(mv[offset:], mv)  # pyre-ignore
         setattr(data, f"_{self._name}", d)
 
 
@@ -374,20 +612,15 @@ class MultiSectionsFixed(DataStructExtraData):
 
     @property
     def size(self):
-        return self._count * self._klass._DataStruct__static_size
+        return self._count * self._klass._static_size
 
     def _check(self, name: str, data: DataStruct) -> None:
         if len(data) < self._offset + self.size:
             raise IndexError(f"Not enough data for {name}= {self.size}")
 
     def _init_extra(self, data: DataStruct):
-        mv = memoryview(data._data)
-        sections = []
-        offset = self._offset
-        for _ in range(self._count):
-            d = self._klass(mv[offset:])  # pyre-ignore
-            offset += len(d)
-            sections.append(d)
+        mv = data._data
+        sections = self._klass._parse_array(mv, self._offset, self._count)
         setattr(data, f"_{self._name}", sections)
 
 
@@ -403,22 +636,66 @@ class MultiSectionsVar(DataStructExtraData):
         num_sections = getattr(data, self._count_var)
         if num_sections < 0:
             raise ValueError("Negative section count")
-        ksize = self._klass._DataStruct__static_size
+        ksize = self._klass._static_size
         if len(data) < self._offset + (num_sections * ksize):
             raise IndexError(f"Not enough data for {name}= {num_sections} * {ksize}")
 
     def _init_extra(self, data: DataStruct):
         num_sections = getattr(data, self._count_var)
-        mv = memoryview(data._data)
-        sections = []
-        offset = self._offset
-        for _ in range(num_sections):
-            d = self._klass(mv[offset:])  # pyre-ignore
-            offset += len(d)
-            sections.append(d)
+        mv = data._data
+        sections = self._klass._parse_array(mv, self._offset, num_sections)
         setattr(data, f"_{self._name}", sections)
 
 
+class MultiSectionsVarSoA(MultiSectionsVar):
+    """Like `MultiSectionsVar`, but decodes the sections into columns
+
+    Gives a dict of `{member: (value, ...)}` for the public members of all
+    sections, instead of one DataStruct per section. Meant for
+    filtering/aggregating over many sections. Needs a fixed-size `klass`.
+
+    Plain `struct` based members are decoded in one pass, through the row
+    layout of `klass`. Others (GUID, HwBytes, Text, ...) go through their
+    `_decode()`, once per section. Extra data (eg. `ParentBody`) is left out.
+    """
+
+    def __init__(self, offset: int, count_var: str, klass: Type[DataStruct]):
+        if klass._dyn_size_member is not None or not klass._static_size:
+            raise TypeError(f"{klass.__name__} has no fixed size, cannot decode columns")
+        super().__init__(offset, count_var, klass)
+        members = {}
+        for k in reversed(klass.__mro__):
+            for n, descr in vars(k).items():
+                if n.startswith("_"):
+                    continue
+                if isinstance(descr, DataStructMember):
+                    members[n] = descr
+                else:
+                    members.pop(n, None)
+        self._columns = tuple(members)
+        self._decoded_members = tuple((n, descr) for n, descr in members.items()
+                                      if n not in klass._row_members)
+
+    def _init_extra(self, data: DataStruct):
+        num_sections = getattr(data, self._count_var)
+        klass = self._klass
+        ssize = klass._static_size
+        mv = data._data[self._offset:self._offset + num_sections * ssize]
+        columns = {}
+        if klass._row_struct is not None:
+            rows = list(zip(*klass._row_struct.iter_unpack(mv))) or [()] * len(klass._row_members)
+            columns.update(zip(klass._row_members, rows))
+        for n, descr in self._decoded_members:
+            values = []
+            for offset in range(0, num_sections * ssize, ssize):
+                # a bare section, just for `_decode()` to read from
+                d = klass.__new__(klass)
+                d._data = mv[offset:offset + ssize]
+                values.append(descr._decode(d))
+            columns[n] = tuple(values)
+        setattr(data, f"_{self._name}", {n: columns[n] for n in self._columns})
+
+
 class ParentBody(DataStructExtraData):
     """Defines a "body" from parent data, indexed by some struct members """
 
@@ -426,17 +703,17 @@ class ParentBody(DataStructExtraData):
         self._offset_var = offset_var
         self._length_var = length_var
 
-    def _check(self, name: str, data: DataStruct) -> None:
-        offset = getattr(data, self._offset_var)
-        length = getattr(data, self._length_var)
-        if not isinstance(data._data, memoryview):
-            raise TypeError("ParentBody only works in nested structs")
-        parent_data = data._data.obj
-        if offset + length > len(parent_data):
-            raise IndexError(f"Not enough data for {name} at data[{offset} + {length}]")
-
     def _init_extra(self, data: DataStruct):
+        # checks need the parent too, so they are done here
+        try:
+            parent = data._parent_data
+        except AttributeError:
+            # parsed straight from a memoryview: index into its root buffer
+            parent = memoryview(data._data.obj)
+        if parent is None:
+            raise TypeError("ParentBody only works in nested structs")
         offset = getattr(data, self._offset_var)
         length = getattr(data, self._length_var)
-        mv = memoryview(data._data.obj)
-        setattr(data, f"_{self._name}", mv[offset:offset+length])
+        if offset + length > len(parent):
+            raise IndexError(f"Not enough data for {self._name} at data[{offset} + {length}]")
+        setattr(data, f"_{self._name}", parent[offset:offset+length])
@@ -16,7 +16,7 @@ from __future__ import annotations
 
 import struct
 
-from .hwstructs import DataStruct2Member, DynSizeBase, Static
+from .hwstructs import DataStruct, DataStruct2Member, DynSizeBase, FastGUID, GUID as _GUID, Static
 
 
 class UShort(DataStruct2Member):
@@ -38,3 +38,15 @@ class StaticUL(Static):
 
 class DynSizeUL(ULong, DynSizeBase):
     """ULong, also used for size of the structure"""
+
+
+class GUID(_GUID):
+    """GUID in the mixed-endian layout of EFI_GUID (as used by UEFI/CPER)
+
+    First three fields are little endian, the last 8 bytes are stored as-is
+    """
+
+    def _decode(self, data: DataStruct):
+        b = bytes(data._data[self._offset:self._offset + 16])
+        # same reordering as `uuid.UUID(bytes_le=)`
+        return FastGUID(b[3::-1] + b[5:3:-1] + b[7:5:-1] + b[8:])
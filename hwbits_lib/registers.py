@@ -13,7 +13,7 @@ from typing import Optional
 
 
 # fmt: off
-class HwBits:
+class HwBits(property):
     """Descriptor for bitfields inside a `HwRegister` class
 
         Use like::
@@ -27,6 +27,8 @@ class HwBits:
             a.active = 0
             print(a)
 
+        Being a `property`, descriptor dispatch happens in C. The accessors
+        get all constants as default arguments, the cheapest reads there are.
     """
     def __init__(self, start: int, stop: Optional[int] = None, doc: str = ""):
         self.offset = start
@@ -36,21 +38,23 @@ class HwBits:
             if stop < start:
                 raise TypeError("bit stop must be greater than start")
             self.bitmask = 2 ** (stop - start + 1) - 1
-        self.__doc__ = doc
+        self._shift_mask = self.bitmask << start
+        self._inv_shift_mask = ~self._shift_mask
 
-    def __get__(self, reg, owner=None):
-        return (reg.value >> self.offset) & self.bitmask
+        def get_bits(reg, _offset=start, _mask=self.bitmask):
+            return (reg.value >> _offset) & _mask
 
-    def __set__(self, reg, value):
-        if not isinstance(value, int):
-            raise TypeError("value must be integer")
+        def set_bits(reg, value, _offset=start, _mask=self.bitmask, _inv_mask=self._inv_shift_mask):
+            if not isinstance(value, int):
+                raise TypeError("value must be integer")
+            reg.value = (reg.value & _inv_mask) | ((value & _mask) << _offset)
 
-        reg.value = ((reg.value & ~(self.bitmask << self.offset))
-                     | ((value & self.bitmask) << self.offset))
-        return value
+        def clear_bits(reg, _inv_mask=self._inv_shift_mask):
+            """Clear the bits, leaving the rest of the register intact"""
+            reg.value &= _inv_mask
 
-    def __delete__(self, reg):
-        reg.value &= self.bitmask << self.offset
+        super().__init__(get_bits, set_bits, clear_bits, doc)
+        self.__doc__ = doc  # property subclasses won't store it themselves
 
 
 class HwRegister:
@@ -80,10 +84,7 @@ class HwRegister:
 
     @classmethod
     def from_bytes_lsb(cls, data: bytes) -> HwRegister:
-        val = 0
-        for i, d in enumerate(data):
-            val |= d << 8 * i
-        return cls(val)
+        return cls(int.from_bytes(data, 'little'))
 
     def __repr__(self):
         return f"<{self.__class__.__name__} 0x{self.value:x}>"